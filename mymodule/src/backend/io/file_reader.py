@@ -3,6 +3,12 @@
 import logging
 from os.path import isfile
 import pandas as pd
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
 
 class FileReader(object):
     """ Static class used for reading a .csv file and
@@ -14,6 +20,9 @@ class FileReader(object):
     DELIMITER = ';'
     USE = ("USE: Files must have .'{}' extension. "+
            "The default delimiter is = '{}'").format(FILE_EXTENSION, DELIMITER)
+    # Same strings pandas.read_csv reads as missing values
+    NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                 '1.#IND', '1.#QNAN', 'N/A', 'NA', 'NULL', 'NaN', 'nan']
 
     @staticmethod
     def read_file(file_path, delimiter=DELIMITER, header=True, index_col=0):
@@ -28,6 +37,10 @@ class FileReader(object):
         FileReader.LOGGER.debug("Reading file '%s'", file_path)
         if (file_path.split('.')[-1].upper() == FileReader.FILE_EXTENSION
                 and isfile(file_path)):
+            if pa_csv is not None:
+                dataframe = FileReader._read_file_arrow(file_path, delimiter, header, index_col)
+                if dataframe is not None:
+                    return dataframe
             dataframe = None
             if header:
                 dataframe = pd.read_csv(file_path, sep=delimiter,
@@ -39,3 +52,42 @@ class FileReader(object):
         else:
             raise ValueError("'%s' was not a valid file\n%s"
                              , (file_path, FileReader.USE))
+
+    @staticmethod
+    def _is_pandas_type(arrow_type):
+        """Returns True if pandas.read_csv can infer the same type for a
+           column: integers, floats, booleans or strings
+        """
+        return (pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+                or pa.types.is_boolean(arrow_type) or pa.types.is_string(arrow_type))
+
+    @staticmethod
+    def _read_file_arrow(file_path, delimiter, header, index_col):
+        """ Same as read_file but parsing the file with the (multi-threaded)
+            PyArrow CSV reader. Every column of the returned DataFrame is
+            kept in its own contiguous block
+            Returns None if a column would not be read as pandas.read_csv
+            does (e.g. Arrow parses timestamps, pandas keeps them as text)
+        """
+        read_options = pa_csv.ReadOptions(autogenerate_column_names=not header)
+        parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+        convert_options = pa_csv.ConvertOptions(null_values=FileReader.NA_VALUES,
+                                                strings_can_be_null=True)
+        table = pa_csv.read_csv(file_path, read_options=read_options,
+                                parse_options=parse_options,
+                                convert_options=convert_options)
+        if not all(FileReader._is_pandas_type(field.type) for field in table.schema):
+            FileReader.LOGGER.debug("Column types not supported by pandas, using pandas reader")
+            return None
+        string_columns = [field.name for field in table.schema
+                          if pa.types.is_string(field.type)]
+        dataframe = table.to_pandas(split_blocks=True, self_destruct=True)
+        # Arrow returns unicode names and text while pandas returns str
+        for column in string_columns:
+            dataframe[column] = dataframe[column].str.encode('utf-8')
+        if header:
+            dataframe.columns = [column.encode('utf-8') for column in dataframe.columns]
+        else:
+            # Same column ids as pandas.read_csv(header=None)
+            dataframe.columns = range(len(dataframe.columns))
+        return dataframe.set_index(dataframe.columns[index_col])
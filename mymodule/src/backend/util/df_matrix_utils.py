@@ -15,16 +15,11 @@ class DFMatrixUtils(object):
         """ Receives a dataframe of columns x0,x1,y0,y1 and returns
             a DataFrame with two columns holding Vx and Vy
         """
-        def get_vector(x0, x1, y0, y1):
-            v_x = x1 - x0
-            v_y = y1 - y0
-            return v_x, v_y
-
         # Create new DataFrame obtaining the vectors from the points
-        vector_matrix = []
-        for _, row in axis_points_df.iterrows():
-            vector_matrix.append(get_vector(row['x0'], row['x1'], row['y0'], row['y1']))
-        vectors_df = pd.DataFrame(vector_matrix, index=axis_points_df.index, columns=["x", "y"])
+        v_x = axis_points_df['x1'].values - axis_points_df['x0'].values
+        v_y = axis_points_df['y1'].values - axis_points_df['y0'].values
+        vectors_df = pd.DataFrame({"x": v_x, "y": v_y}, index=axis_points_df.index,
+                                  columns=["x", "y"])
 
         return vectors_df
 
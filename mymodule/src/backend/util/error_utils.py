@@ -2,6 +2,10 @@
     ErrorUtils
 """
 
+import numpy as np
+import pandas as pd
+from .numba_kernels import general_error
+
 class ErrorUtils(object):
     """Class holding common utils for error algorithms"""
 
@@ -14,23 +18,13 @@ class ErrorUtils(object):
             Returns: (pandas.DataFrame) product_id X (x,y) columns where each cell contains
             the absolute error value for that point on that coordenate component
         """
-        def get_column_error(column, vectors_df, mapped_points_df_t):
-            column_expected_x = (column * vectors_df['x']).abs()
-            column_expected_y = (column * vectors_df['y']).abs()
-            column_index = column.name
-            column_mapped_x = mapped_points_df_t[column_index]['x']
-            column_mapped_y = mapped_points_df_t[column_index]['y']
-            column_error_x = (column_expected_x - column_mapped_x).abs()
-            column_error_y = (column_expected_y - column_mapped_y).abs()
-            column_error = column_error_x + column_error_y
-            return column_error
-
-        values_df_t_cp = values_df.transpose()
-        mapped_points_df_t = mapped_points_df.transpose()
-        # Avoid duplicated names assigning new column IDs
-        column_ids = [i for i in xrange(0, len(values_df_t_cp.columns))]
-        values_df_t_cp.columns = column_ids
-        mapped_points_df_t.columns = column_ids
-        values_df_t_cp = values_df_t_cp.apply(lambda column: get_column_error(column, vectors_df, mapped_points_df_t), axis=0)
-        general_error_df = values_df_t_cp.transpose()
+        # Vectors in the same order as the dimensions of the values
+        vectors_df = vectors_df.reindex(values_df.columns)
+        error_matrix = general_error(np.ascontiguousarray(values_df.values, dtype=np.float64),
+                                      vectors_df['x'].values.astype(np.float64),
+                                      vectors_df['y'].values.astype(np.float64),
+                                      mapped_points_df['x'].values.astype(np.float64),
+                                      mapped_points_df['y'].values.astype(np.float64))
+        # Points are identified by position to avoid duplicated names
+        general_error_df = pd.DataFrame(error_matrix, columns=values_df.columns)
         return general_error_df
@@ -17,3 +17,22 @@ def calculate_line_equation(x0x1, y0y1):
     m, c = np.linalg.lstsq(A, y0y1)[0]
 
     return m, c
+
+def calculate_line_equations(x0x1, y0y1):
+    """Vectorized version of calculate_line_equation for many lines at once,
+       each one defined by the points (x0[i], y0[i]) and (x1[i], y1[i]).
+       Lines with x0[i] == x1[i] get m = 0 and c = y0[i]
+       x0x1: (Tuple(numpy.ndarray, numpy.ndarray)): holding the X coordinates
+       y0y1: (Tuple(numpy.ndarray, numpy.ndarray)): holding the Y coordinates
+       Returns:
+       'm': (numpy.ndarray) calculated m constant for each line
+       'c': (numpy.ndarray) calculated c constant for each line
+    """
+    x0, x1 = x0x1
+    y0, y1 = y0y1
+    dx = x1 - x0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m = np.where(dx != 0, (y1 - y0) / dx, 0.0)
+    c = y0 - m * x0
+
+    return m, c
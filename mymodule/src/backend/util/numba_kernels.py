@@ -0,0 +1,116 @@
+"""
+    Numba kernels
+"""
+
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = xrange
+
+# Below this number of points spreading an animation frame across threads costs more
+# than computing it in a single one
+PARALLEL_THRESHOLD = 4096
+
+
+def _general_error_loop(values, vectors_x, vectors_y, mapped_x, mapped_y, out):
+    """Writes on out the absolute error of every point on every dimension.
+       Meant to be compiled with Numba, every point (row) is independent
+       from the rest so the rows are split across threads
+    """
+    for i in prange(values.shape[0]):
+        for j in range(values.shape[1]):
+            value = values[i, j]
+            out[i, j] = abs(abs(value * vectors_x[j]) - mapped_x[i])\
+                        + abs(abs(value * vectors_y[j]) - mapped_y[i])
+
+
+def _general_error_numpy(values, vectors_x, vectors_y, mapped_x, mapped_y, out):
+    """NumPy equivalent of _general_error_loop used when Numba is missing"""
+    error_y = np.multiply(values, vectors_y)
+    np.abs(error_y, out=error_y)
+    error_y -= mapped_y[:, None]
+    np.abs(error_y, out=error_y)
+    np.multiply(values, vectors_x, out=out)
+    np.abs(out, out=out)
+    out -= mapped_x[:, None]
+    np.abs(out, out=out)
+    out += error_y
+
+
+if njit is not None:
+    _general_error_parallel = njit(cache=True, parallel=True)(_general_error_loop)
+
+
+def general_error(values, vectors_x, vectors_y, mapped_x, mapped_y):
+    """Calculates |abs(v * vx) - x| + |abs(v * vy) - y| for every point
+       and dimension with the fastest available kernel
+       values: (numpy.ndarray) n_points X n_dimensions values
+       vectors_x, vectors_y: (numpy.ndarray) components of each dimension vector
+       mapped_x, mapped_y: (numpy.ndarray) mapped coordinates of each point
+       Returns: (numpy.ndarray) n_points X n_dimensions float64 error values
+    """
+    out = np.empty(values.shape, dtype=np.float64)
+    if njit is None:
+        _general_error_numpy(values, vectors_x, vectors_y, mapped_x, mapped_y, out)
+    else:
+        _general_error_parallel(values, vectors_x, vectors_y, mapped_x, mapped_y, out)
+    return out
+
+
+def _compute_frame_loop(x0, y0, dx, m, progress, x_out, y_out):
+    """Writes on x_out and y_out the position of the points at the given
+       progress of their path. Single fused loop meant to be compiled
+       with Numba, so no temporary arrays are created
+    """
+    for i in range(x0.size):
+        shift = progress * dx[i]
+        x_out[i] = x0[i] + shift
+        y_out[i] = y0[i] + m[i] * shift
+
+
+def _compute_frame_prange(x0, y0, dx, m, progress, x_out, y_out):
+    """Same as _compute_frame_loop but every point is independent from the
+       rest, so the loop is split across threads
+    """
+    for i in prange(x0.size):
+        shift = progress * dx[i]
+        x_out[i] = x0[i] + shift
+        y_out[i] = y0[i] + m[i] * shift
+
+
+def _compute_frame_array(x0, y0, dx, m, progress, x_out, y_out, xp=np):
+    """Array equivalent of _compute_frame_loop used when Numba is missing
+       and for GPU arrays. The shift along x is kept on x_out so no
+       temporary array is created
+       xp: (module) numpy or cupy, depending on where the arrays live
+    """
+    xp.multiply(dx, progress, out=x_out)
+    xp.multiply(m, x_out, out=y_out)
+    xp.add(y_out, y0, out=y_out)
+    xp.add(x_out, x0, out=x_out)
+
+
+if njit is not None:
+    _compute_frame_serial = njit(cache=True, fastmath=True)(_compute_frame_loop)
+    _compute_frame_parallel = njit(cache=True, fastmath=True, parallel=True)(_compute_frame_prange)
+
+
+def compute_frame(x0, y0, dx, m, progress, x_out, y_out, xp=np):
+    """Computes a frame of the animation with the fastest available kernel
+       x0, y0: (numpy.ndarray) original coordinates of the points
+       dx: (numpy.ndarray) distance along x to the final coordinates
+       m: (numpy.ndarray) slope of the path of each point
+       progress: (float) 0 for the original position, 1 for the final one
+       x_out, y_out: (numpy.ndarray) buffers where the frame is written
+       xp: (module) numpy, or cupy when the arrays live on the GPU
+    """
+    if xp is not np:
+        _compute_frame_array(x0, y0, dx, m, progress, x_out, y_out, xp=xp)
+    elif njit is None:
+        _compute_frame_array(x0, y0, dx, m, progress, x_out, y_out)
+    elif x0.size < PARALLEL_THRESHOLD:
+        _compute_frame_serial(x0, y0, dx, m, progress, x_out, y_out)
+    else:
+        _compute_frame_parallel(x0, y0, dx, m, progress, x_out, y_out)
@@ -14,6 +14,7 @@ GestureTool = require "models/tools/gestures/gesture_tool"
 p = require "core/properties"
 class DragToolView extends GestureTool.View
   active_source = null
+  active_index = null
   initialize: (options) ->
     super(options)
     @listenTo(@model, 'change:active', @_active_change)
@@ -26,16 +27,21 @@ class DragToolView extends GestureTool.View
     x = frame.x_mappers['default'].map_from_target(vx)
     y = frame.y_mappers['default'].map_from_target(vy)
     min_distance = null
-    closer_source = null
-    active_sources = @model.sources.data.active_sources
-    for i in [0..active_sources.length - 1]
-      a = x - active_sources[i].data.x1
-      b = y - active_sources[i].data.y1
+    active_source = null
+    active_index = null
+    # The source holds one axis per row
+    source = @model.source
+    for i in [0...source.data.x1.length]
+      # Hidden axis can not be dragged
+      if source.data.alpha[i] == 0
+        continue
+      a = x - source.data.x1[i]
+      b = y - source.data.y1[i]
       d = Math.sqrt(a**2 + b**2)
       if (min_distance == null || d < min_distance)
         min_distance = d
-        closer_source = active_sources[i]
-    active_source = closer_source
+        active_source = source
+        active_index = i
     return null
 
   _pan: (e) ->
@@ -45,15 +51,19 @@ class DragToolView extends GestureTool.View
     vy = canvas.sy_to_vy(e.bokeh.sy)
     x = frame.x_mappers['default'].map_from_target(vx)
     y = frame.y_mappers['default'].map_from_target(vy)
-    active_source.data.x1[0] = x
-    active_source.data.y1[0] = y
+    if active_source == null
+      return null
+    active_source.data.x1[active_index] = x
+    active_source.data.y1[active_index] = y
 
     active_source.trigger('change')
 
   _pan_end: (e) ->
-    @model.remap_square.glyph.name = active_source.data['name'][0]
-    @model.remap_square.glyph.x = active_source.data['x1'][0]
-    @model.remap_square.glyph.y = active_source.data['y1'][0]
+    if active_source == null
+      return null
+    @model.remap_square.glyph.name = active_source.data['name'][active_index]
+    @model.remap_square.glyph.x = active_source.data['x1'][active_index]
+    @model.remap_square.glyph.y = active_source.data['y1'][active_index]
     @model.remap_square.visible = !@model.remap_square.visible
     @model.remap_square.trigger('change')
 
@@ -67,7 +77,7 @@ class DragTool extends GestureTool.Model
   event_type: "pan"
   default_order: 12
   @define {
-      sources:                [ p.Instance ]
+      source:                 [ p.Instance ]
       remap_square:           [ p.Instance ]
     }
 module.exports =
@@ -75,5 +85,5 @@ module.exports =
   View: DragToolView
     """
 
-    sources = Instance(ColumnDataSource)
+    source = Instance(ColumnDataSource)
     remap_square = Instance(GlyphRenderer)
@@ -5,95 +5,224 @@
 from __future__ import division
 import logging
 import time
-import pandas as pd
-from ....backend.util.line_equation import calculate_line_equation
+import numpy as np
+from bokeh.io import curdoc
+from ....backend.util.line_equation import calculate_line_equations
+from ....backend.util.numba_kernels import compute_frame
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+# Maximum size in bytes of the x and y coordinates of all the frames of an
+# animation for them to be precomputed at once
+MEMORY_BUDGET = 64 * 1024 * 1024
+# From this number of points on, the frames are computed on the GPU when
+# CuPy is installed
+GPU_THRESHOLD = 1000000
+
+
+def get_array_module(n_points):
+    """Returns the module used to compute the frames for n_points points:
+       cupy for large animations when it is installed, numpy otherwise
+    """
+    if cupy is not None and n_points >= GPU_THRESHOLD:
+        return cupy
+    return np
 
 
 class MappingAnimator(object):
     """Object that creates animations between two positions for points"""
     LOGGER = logging.getLogger(__name__)
+    # Frames per second of the animations
+    TARGET_FPS = 60
+    # Milliseconds between two frames
+    FRAME_PERIOD = 1000 / TARGET_FPS
 
     def __init__(self, point_controller):
         """source_points: (ColumnDataSource) source where to update the values
         """
         self._point_controller = point_controller
+        # Frame buffers, reused by every animation. While animating they are
+        # the very arrays held by the points source, so each frame is written
+        # in place and no new arrays are allocated
+        n_points = point_controller.get_number_of_points()
+        self._x_buf = np.empty(n_points, dtype=np.float32)
+        self._y_buf = np.empty(n_points, dtype=np.float32)
+        # Line followed by each point, y = y0 + m(x - x0), where x moves
+        # from x0 to x0 + dx. Set by _init_line_equations
+        self._x0 = None
+        self._y0 = None
+        self._dx = None
+        self._m = None
+        # Module holding the arrays above (numpy, or cupy on the GPU)
+        self._xp = np
+        # (document, function of the periodic callback) of the animation
+        # being played. Bokeh removes the callbacks by their function
+        self._playback = None
 
     @staticmethod
-    def step_x_exponential(step_points_df, final_points, step, total_steps):
-        for i in range(0, len(step_points_df['x'])):
-            x0 = step_points_df['x'][i]
-            xf = final_points['x'][i]
-            step_points_df['x'][i] = x0 + step * (xf - x0) / total_steps
-        return step_points_df
+    def step_progress_exponential(progress, step_fraction):
+        """Moves the progress a step_fraction of the remaining distance to
+           the final position
+           progress: (float) fraction of the path already covered [0, 1]
+           step_fraction: (float) step / total_steps
+           Returns: (float) new progress
+        """
+        return progress + step_fraction * (1 - progress)
 
     @staticmethod
-    def step_x_constant(original_points, step_points_df, final_points, step, total_steps):
-        for i in range(0, len(original_points['x'])):
-            x0 = original_points['x'][i]
-            xf = final_points['x'][i]
-            step_points_df['x'][i] = x0 + step * (xf - x0) / total_steps
-        return step_points_df
+    def get_progress_sequence(total_steps):
+        """Will calculate the progress of every frame of the animation.
+           The original position (progress 0) is not a frame and the
+           sequence ends on the first frame reaching the final position
+           total_steps: (int) maximum number of frames of the animation
+           Returns: (numpy.ndarray) float32 array with up to total_steps
+                    values, the last one being 1
+        """
+        progress_s = np.empty(total_steps, dtype=np.float32)
+        inv_total = 1 / total_steps if total_steps else 0
+        progress = 0
+        for step in range(1, total_steps + 1):
+            progress = MappingAnimator.step_progress_exponential(progress, step * inv_total)
+            progress_s[step - 1] = progress
+            # The remaining frames would be the same
+            if progress_s[step - 1] >= 1:
+                return progress_s[:step]
+        progress_s[-1] = 1
+        return progress_s
 
-    @staticmethod
-    def evaluate_y(points_df, formula):
-        points_df.eval('y = {}'.format(formula), inplace=True)
-
-    def calculate_time_cost(self, points_df, mapped_points, formula):
-        start_time = time.time()
-        MappingAnimator.step_x_exponential(points_df, mapped_points, 0, 1)
-        MappingAnimator.evaluate_y(points_df, formula)
-        self._point_controller.update_coordinates(points_df['x'], points_df['y'])
-        end_time = time.time()
-        time_cost = end_time - start_time
-        MappingAnimator.LOGGER.debug("Time cost: {}s".format(time_cost))
-        MappingAnimator.LOGGER.debug("Freq: {}s".format(1/time_cost))
-        return time_cost
-
-    def get_animation_sequence(self, original_points, mapped_points, max_time=2):
-        """Will map the points for every step of the sequence by updating
-           the ColumnDataSource
-
-           original_points: (pandas.Dataframe) position of the points before
-           mapped_points: (pandas.Dataframe) end position of the points
+    def get_animation_sequence(self, original_xy, mapped_xy, max_time=2, document=None):
+        """Will move the points through every frame of the sequence by
+           updating the ColumnDataSource, one frame every FRAME_PERIOD ms
+
+           original_xy: (numpy.ndarray) 2 X n_points float32 array with the
+                        x and y coordinates of the points before
+           mapped_xy: (numpy.ndarray) 2 X n_points float32 array with the
+                      x and y coordinates of the points at the end
+           [max_time=2]: (float) maximum duration in seconds
+           [document=None]: (bokeh.document.Document) document whose session
+                            plays the animation. Defaults to curdoc()
+           The points are left at mapped_xy once the animation ends. Any
+           animation still being played is stopped
+        """
+        self._stop()
+        if document is None:
+            document = curdoc()
+        # Nothing to animate: either there is no previous position (or it
+        # belongs to a different set of points), the points do not move or
+        # there is no browser session to show the frames
+        if (original_xy is None or original_xy.shape != mapped_xy.shape or
+                document.session_context is None or
+                np.allclose(original_xy, mapped_xy, atol=1e-9)):
+            self._point_controller.update_coordinates(*mapped_xy)
+            return
+
+        self._init_line_equations(original_xy, mapped_xy)
+        progress_s = MappingAnimator.get_progress_sequence(
+            max(1, int(max_time * MappingAnimator.TARGET_FPS)))
+        MappingAnimator.LOGGER.debug("Total frames: %s", progress_s.size)
+        show_frame = self._get_frame_function(progress_s[:-1])
+        n_frames = progress_s.size
+        start = time.time()
+        # Last frame shown, as a list so the callback can update it
+        last_frame = [-1]
+
+        def play():
+            # Frame due by now. When the callback runs late the frames in
+            # between are skipped, so the animation never lasts longer
+            frame = min(int((time.time() - start) * MappingAnimator.TARGET_FPS), n_frames - 1)
+            if frame <= last_frame[0]:
+                return
+            last_frame[0] = frame
+            if frame < n_frames - 1:
+                show_frame(frame)
+            else:
+                MappingAnimator.LOGGER.debug("Finished animation")
+                self._point_controller.update_coordinates(*mapped_xy)
+                self._stop()
+
+        document.add_periodic_callback(play, MappingAnimator.FRAME_PERIOD)
+        self._playback = (document, play)
+
+    def _stop(self):
+        """Stops the animation being played, if any"""
+        if self._playback is not None:
+            document, play = self._playback
+            self._playback = None
+            document.remove_periodic_callback(play)
+
+    def _get_frame_function(self, progress_s):
+        """progress_s: (numpy.ndarray) progress of every frame
+           Returns: (function) receiving a frame index that moves the points
+                    to that frame
+        """
+        xp = self._xp
+        if 2 * progress_s.size * self._x0.nbytes <= MEMORY_BUDGET:
+            frames_x, frames_y = self._to_host(*self._compute_all_frames(xp.asarray(progress_s)))
+            return lambda frame: self._point_controller.update_coordinates(frames_x[frame],
+                                                                           frames_y[frame])
+        if xp is not np:
+            x_out, y_out = xp.empty_like(self._x0), xp.empty_like(self._y0)
+        else:
+            if self._x_buf.size != self._x0.size:
+                self._x_buf = np.empty_like(self._x0)
+                self._y_buf = np.empty_like(self._y0)
+            x_out, y_out = self._x_buf, self._y_buf
+        return lambda frame: self._update_frame(progress_s[frame], x_out, y_out)
+
+    def _update_frame(self, progress, x_out, y_out):
+        """Moves the points to the given fraction of their path
+           progress: (float) 0 for the original position, 1 for the final one
+           x_out, y_out: (numpy.ndarray) buffers where the frame is computed
+        """
+        # float32 progress so the whole kernel runs in single precision
+        compute_frame(self._x0, self._y0, self._dx, self._m, np.float32(progress),
+                      x_out, y_out, xp=self._xp)
+        self._point_controller.update_coordinates(*self._to_host(x_out, y_out))
+
+    def _to_host(self, *arrays):
+        """Bokeh only takes host arrays, so GPU arrays are copied back
+           arrays: (numpy.ndarray or cupy.ndarray) arrays to return
+           Returns: (list) numpy.ndarray of each array
+        """
+        if self._xp is np:
+            return arrays
+        return [self._xp.asnumpy(array) for array in arrays]
+
+    def _compute_all_frames(self, progress_s):
+        """Will calculate the position of the points for every frame at once
+           progress_s: (numpy.ndarray) progress of every frame
+           Returns: (numpy.ndarray, numpy.ndarray) float32 arrays with shape
+                    (n_frames X n_points) for the x and y coordinates
         """
+        frames_x = progress_s[:, None] * self._dx
+        frames_y = self._m * frames_x
+        frames_y += self._y0
+        frames_x += self._x0
+        return frames_x, frames_y
 
-        # First, we get the cost time by simulating an animation from P0 to P'0
-        # where P'0 has the same coordinates (this way we include the
-        # rendering time without modifying the position)
-        # TODO gchicafernandez - Find a way to parallelize this. Takes forever!
-        step_points_cp, formula = self._get_equation_dataframe(original_points, mapped_points)
-        time_cost = self.calculate_time_cost(step_points_cp, mapped_points, formula)
-        total_steps = int(max_time // time_cost)
-        MappingAnimator.LOGGER.debug("Total steps: {}".format(total_steps))
-        for step in range(0, total_steps):
-            MappingAnimator.step_x_exponential(step_points_cp, mapped_points, step, total_steps)
-            MappingAnimator.evaluate_y(step_points_cp, formula)
-            self._point_controller.update_coordinates(step_points_cp['x'], step_points_cp['y'])
-
-        MappingAnimator.LOGGER.debug("Finished animation")
-        self._point_controller.update_coordinates(mapped_points['x'], mapped_points['y'])
-
-    def _get_equation_dataframe(self, original_points, mapped_points):
+    def _init_line_equations(self, original_xy, mapped_xy):
         """Being the equation of the line: y = mx + c where m and c are
-           constants, this method will return a dataframe composed by the
-           following columns:
-           'x': x points (with values as per original_points df)
-           'm': calculated p constant for each point
-           'c': calculated c constant for each point
-           'y': equation 'mx + c'
+           constants, this method will cache as float32 ndarrays:
+           x0, y0: original points (with values as per original_xy)
+           dx: distance along x between the original and mapped points
+           m: calculated m constant for each point
+           They are moved to the GPU when get_array_module returns cupy
+           The line is evaluated as y = y0 + m(x - x0) instead of using c,
+           since c = y0 - m * x0 loses all precision in float32 for steep
+           lines (e.g. when an axis is dragged vertically)
+           original_xy: (numpy.ndarray) 2 X n_points x and y coordinates
+           mapped_xy: (numpy.ndarray) 2 X n_points x and y coordinates
         """
-        formula = 'm * x + c'
-        original_points_cp = original_points.copy()
-        x_coords = zip(original_points['x'], mapped_points['x'])
-        y_coords = zip(original_points['y'], mapped_points['y'])
-        points = zip(x_coords, y_coords)
-        m_l = []
-        c_l = []
-        for x0x1, y0y1 in points:
-            m, c = calculate_line_equation(x0x1, y0y1)
-            m_l.append(m)
-            c_l.append(c)
-        original_points_cp['m'] = pd.Series(m_l, index=original_points_cp.index)
-        original_points_cp['c'] = pd.Series(c_l, index=original_points_cp.index)
-
-        return original_points_cp, formula
+        # Contiguous buffers so every vectorized pass is a single linear read.
+        # ascontiguousarray only copies when the input is strided or float64
+        x0, y0 = np.ascontiguousarray(original_xy, dtype=np.float32)
+        xf, yf = np.ascontiguousarray(mapped_xy, dtype=np.float32)
+        m = calculate_line_equations((x0, xf), (y0, yf))[0]
+        xp = get_array_module(x0.size)
+        self._xp = xp
+        self._m = xp.asarray(m)
+        self._x0 = xp.asarray(x0)
+        self._y0 = xp.asarray(y0)
+        self._dx = xp.asarray(xf - x0)
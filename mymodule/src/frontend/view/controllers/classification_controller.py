@@ -17,7 +17,7 @@ class ClassificationController(AbstractAlgorithmController):
     NONE_SOURCE_ID = 'None'
 
     def __init__(self, input_data_controller, cluster_controller, normalization_controller,
-                 axis_sources, algorithm_id=None):
+                 axis_source, algorithm_id=None):
         algorithm_dict = ClassificationRegister.get_algorithm_dict()
         super(ClassificationController, self).\
               __init__(AbstractAlgorithmController.NONE_ALGORITHM_ID,
@@ -27,7 +27,7 @@ class ClassificationController(AbstractAlgorithmController):
         self._input_data_controller = input_data_controller
         self._cluster_controller = cluster_controller
         self._normalization_controller = normalization_controller
-        self._axis_sources = axis_sources
+        self._axis_source = axis_source
         self._active_source = ClassificationController.NONE_SOURCE_ID
 
     def relocate_axis(self):
@@ -56,11 +56,17 @@ class ClassificationController(AbstractAlgorithmController):
                                                            categories)
         else:
             relocated_axis = self.execute_active_algorithm(dimension_values_df_norm)
-        for source in self._axis_sources:
-            axis_id = source.data['name'][0]
+        axis_ids = self._axis_source.data['name']
+        # Positions in the same order as the axis source rows
+        relocated_xy = relocated_axis[['x', 'y']].reindex(axis_ids).values
+        patch_x1 = []
+        patch_y1 = []
+        for i, axis_id in enumerate(axis_ids):
             if self._input_data_controller.is_label_active(axis_id):
-                source.data['x1'] = [relocated_axis['x'][axis_id]]
-                source.data['y1'] = [relocated_axis['y'][axis_id]]
+                patch_x1.append((i, relocated_xy[i, 0]))
+                patch_y1.append((i, relocated_xy[i, 1]))
+        if patch_x1:
+            self._axis_source.patch({'x1': patch_x1, 'y1': patch_y1})
         ClassificationController.LOGGER.debug("Relocation completed")
         return relocated_axis
 
@@ -1,7 +1,10 @@
 """
     Clustering controller
 """
+import hashlib
 import logging
+from collections import OrderedDict
+import numpy as np
 from ....backend.algorithms.error.error_register import ErrorRegister
 from ....backend.algorithms.error.absolute_sum_error import ABSOLUTE_SUM_ID
 from .abstract_algorithm_controller import AbstractAlgorithmController
@@ -9,9 +12,15 @@ from .abstract_algorithm_controller import AbstractAlgorithmController
 class ErrorController(AbstractAlgorithmController):
     """Controls the error value of the points"""
     LOGGER = logging.getLogger(__name__)
+    # Number of results kept to be reused when the same configuration is
+    # mapped again (e.g. hiding an axis and showing it back)
+    CACHE_SIZE = 16
+    # Below this number of values (points X dimensions) the error is cheaper
+    # to calculate than to fingerprint
+    CACHE_MIN_VALUES = 100000
 
     def __init__(self, normalization_controller, vector_controller, mapper_controller,
-                 point_controller, axis_sources, algorithm_id=None):
+                 point_controller, axis_source, algorithm_id=None):
         algorithm_dict = ErrorRegister.get_algorithm_dict()
         super(ErrorController, self).__init__(ABSOLUTE_SUM_ID,
                                               algorithm_dict,
@@ -21,11 +30,13 @@ class ErrorController(AbstractAlgorithmController):
         self._vector_controller = vector_controller
         self._mapper_controller = mapper_controller
         self._point_controller = point_controller
-        self._axis_sources = axis_sources
+        self._axis_source = axis_source
         self._last_axis_error_s = None
         self._last_point_error_s = None
         self._last_axis_error_s_norm = None
         self._last_point_error_s_norm = None
+        # {inputs fingerprint: (axis_error_df, point_error_df)} in LRU order
+        self._error_cache = OrderedDict()
 
     def calculate_error(self):
         """values_df_norm: (pandas.DataFrame) product X dimension_value
@@ -38,9 +49,7 @@ class ErrorController(AbstractAlgorithmController):
         vectors_df = self._vector_controller.get_vectors()
         mapped_points_df = self._mapper_controller.get_mapped_points()
         axis_error_df, \
-        point_error_df = self.execute_active_algorithm(values_df_norm,
-                                                       vectors_df,
-                                                       mapped_points_df)
+        point_error_df = self._execute_cached(values_df_norm, vectors_df, mapped_points_df)
         # Normalize the error values at DataFrame level (i.e. comparing all matrix values)
         self._last_axis_error_s_norm = self._normalization_controller\
                                         .normalize_feature_scaling(axis_error_df, df_level=True)[0]
@@ -50,26 +59,57 @@ class ErrorController(AbstractAlgorithmController):
         point_error_s = point_error_df[0]
         axis_error_s = axis_error_df[0]
         self._point_controller.update_errors(point_error_s)
-        # Go through the axis sources and update (or initialize) the error
-        # Note: every axis has its own source
-        for i in xrange(0, len(self._axis_sources)):
-            axis_id = self._axis_sources[i].data['name'][0]
-            if not axis_id in axis_error_df.index:
-                continue
-            new_value = axis_error_df.at[axis_id, 0]
-            if not 'error' in self._axis_sources[i].data:
-                self._axis_sources[i].data['error'] = [new_value]
-            else:
-                patch_error = {
-                    # Assigned as: (indexToReplace, newValue)
-                    'error': [(0, new_value)]
-                }
-                self._axis_sources[i].patch(patch_error)
+        # Update the error of the axis in the source
+        # Note: all axis share the same source, with one row per axis
+        patch_error = [(i, axis_error_df.at[axis_id, 0])
+                       for i, axis_id in enumerate(self._axis_source.data['name'])
+                       if axis_id in axis_error_df.index]
+        if patch_error:
+            # Assigned as: (indexToReplace, newValue)
+            self._axis_source.patch({'error': patch_error})
 
         self._last_axis_error_s = axis_error_s
         self._last_point_error_s = point_error_s
         return axis_error_s, point_error_s
 
+    def _get_cache_key(self, values_df_norm, vectors_df, mapped_points_df):
+        """Returns: (tuple) fingerprint of the error inputs or None if they are
+                    too small to be worth caching
+        """
+        if values_df_norm.size < ErrorController.CACHE_MIN_VALUES:
+            return None
+        mapped_points = np.ascontiguousarray(mapped_points_df[['x', 'y']].values)
+        # The input data of a view does not change, so the normalized values
+        # are identified by the normalization algorithm and their columns
+        return (self.get_active_algorithm_id(),
+                self._normalization_controller.get_active_algorithm_id(),
+                tuple(values_df_norm.columns),
+                tuple(vectors_df.index),
+                vectors_df[['x', 'y']].values.tobytes(),
+                hashlib.sha1(mapped_points).hexdigest())
+
+    def _execute_cached(self, values_df_norm, vectors_df, mapped_points_df):
+        """Executes the active algorithm unless the same inputs were among the
+           last CACHE_SIZE calculations
+           Returns: (pandas.DataFrame) error value for each axis
+                    (pandas.DataFrame) error value for each point
+        """
+        key = self._get_cache_key(values_df_norm, vectors_df, mapped_points_df)
+        if key is not None and key in self._error_cache:
+            ErrorController.LOGGER.debug("Reusing cached error")
+            # Re-inserted as the most recently used
+            errors = self._error_cache.pop(key)
+        else:
+            errors = self.execute_active_algorithm(values_df_norm,
+                                                   vectors_df,
+                                                   mapped_points_df)
+            if key is None:
+                return errors
+            if len(self._error_cache) >= ErrorController.CACHE_SIZE:
+                self._error_cache.popitem(last=False)
+        self._error_cache[key] = errors
+        return errors
+
     def get_last_axis_error(self, normalized=False):
         """Returns (pandas.Series) last calculated error value for each axis"""
         last_axis_error = self._last_axis_error_s
@@ -2,6 +2,8 @@
     Mapper Controller Module
 """
 import logging
+import numpy as np
+import pandas as pd
 from ....backend.algorithms.mapping.mapping_register import MappingRegister
 from ....backend.algorithms.mapping.star_coordinates_mapper import STAR_COORDINATES_ID
 from .abstract_algorithm_controller import AbstractAlgorithmController
@@ -24,30 +26,124 @@ class MapperController(AbstractAlgorithmController):
         self._point_controller = point_controller
         self._vector_controller = vector_controller
         self._normalization_controller = normalization_controller
-        self._animator = animator
+        self._animator = None
         self._last_mapped_points_df = None
+        self._mapped_xy = None
+        # Last full Star Coordinates projection P0 = X . W0, as the tuple
+        # (normalized values DataFrame, X, W0, P0) with float64 ndarrays
+        self._last_projection = None
+        self.set_animator(animator)
 
-    def execute_mapping(self):
-        """Will recalculate the mapping for the points
+    def _map_points(self):
+        """Executes the active algorithm over the normalized values
            Returns: (pandas.DataFrame) Mapped points with shape
                     (point_name X {x, y})
+                    (numpy.ndarray) 2 X n_points float32 buffer with the same
+                    coordinates (x row, y row)
         """
         # Note: under the covers these values are filtered according to the
         # ignored labels set of InputDataController
         dimension_values_df_norm = self._normalization_controller.get_last_normalized_values()
         vectors_df = self._vector_controller.get_vectors()
-        MapperController.LOGGER.debug("Mapping with %s", self.get_active_algorithm_id())
-        mapped_points_df = self.execute_active_algorithm(dimension_values_df_norm,
-                                                         vectors_df)
-        if self._animator and self._last_mapped_points_df is not None:
-            MapperController.LOGGER.debug("Executing animation")
-            self._animator.get_animation_sequence(self._last_mapped_points_df,
-                                                  mapped_points_df)
+        if MapperController.LOGGER.isEnabledFor(logging.DEBUG):
+            MapperController.LOGGER.debug("Mapping with %s", self.get_active_algorithm_id())
+        mapped_points_df = None
+        if self.get_active_algorithm_id() == STAR_COORDINATES_ID:
+            mapped_points_df = self._update_projection(dimension_values_df_norm, vectors_df)
+        if mapped_points_df is None:
+            mapped_points_df = self.execute_active_algorithm(dimension_values_df_norm,
+                                                             vectors_df)
+            self._set_last_projection(dimension_values_df_norm, vectors_df, mapped_points_df)
+        # Single 2 X n_points float32 buffer (x row, y row) shared by the
+        # animator and the points source so that no pandas indexing happens
+        # on the way to Bokeh
+        mapped_xy = np.ascontiguousarray(mapped_points_df[['x', 'y']].values.T,
+                                         dtype=np.float32)
+        return mapped_points_df, mapped_xy
+
+    @staticmethod
+    def _get_aligned_vectors(dimension_values_df, vectors_df):
+        """Returns: (numpy.ndarray) n_dimensions X 2 vectors in the same order
+                    as the dimension columns
+        """
+        return vectors_df[['x', 'y']].reindex(dimension_values_df.columns).values
+
+    def _set_last_projection(self, dimension_values_df, vectors_df, mapped_points_df):
+        """Keeps the Star Coordinates projection so it can be updated when
+           only some vectors change
+        """
+        if self.get_active_algorithm_id() != STAR_COORDINATES_ID:
+            self._last_projection = None
+            return
+        self._last_projection = (dimension_values_df,
+                                 np.ascontiguousarray(dimension_values_df.values,
+                                                      dtype=np.float64),
+                                 MapperController._get_aligned_vectors(dimension_values_df,
+                                                                       vectors_df),
+                                 np.array(mapped_points_df[['x', 'y']].values, dtype=np.float64))
+
+    def _update_projection(self, dimension_values_df, vectors_df):
+        """Star Coordinates maps with the projection P = X . W, so when the
+           normalized values X are the same as in the last full projection
+           P0 = X . W0 and only a few vectors moved since (e.g. an axis was
+           dragged) P is calculated with the moved rows only:
+           P = P0 + X[:, moved] . (W - W0)[moved]
+           Always starting from P0 the rounding errors do not build up and
+           the same vectors give the very same projection
+           Returns: (pandas.DataFrame) mapped points or None if the projection
+                    has to be calculated from scratch
+        """
+        if self._last_projection is None:
+            return None
+        last_values_df, values, full_vectors, projection = self._last_projection
+        if dimension_values_df is not last_values_df:
+            return None
+        vectors = MapperController._get_aligned_vectors(dimension_values_df, vectors_df)
+        if np.isnan(vectors).any():
+            return None
+        moved = np.flatnonzero((vectors != full_vectors).any(axis=1))
+        # Past half of the vectors the full product is as cheap, and it
+        # becomes the new P0
+        if 2 * moved.size > vectors.shape[0]:
+            return None
+        if moved.size:
+            projection = projection + values[:, moved].dot(vectors[moved] - full_vectors[moved])
+        else:
+            # P0 is kept untouched for the next updates
+            projection = projection.copy()
+        return pd.DataFrame(projection, index=dimension_values_df.index, columns=['x', 'y'])
+
+    def _execute_mapping_plain(self):
+        """execute_mapping when there is no animator: the points are moved
+           straight to their new position
+        """
+        mapped_points_df, mapped_xy = self._map_points()
         self._last_mapped_points_df = mapped_points_df
-        self._point_controller.update_coordinates(mapped_points_df['x'], mapped_points_df['y'])
+        self._mapped_xy = mapped_xy
+        self._point_controller.update_coordinates(mapped_xy[0], mapped_xy[1])
 
         return mapped_points_df
 
+    def _execute_mapping_animated(self):
+        """execute_mapping when there is an animator: the points transition
+           from their last position to the new one
+        """
+        mapped_points_df, mapped_xy = self._map_points()
+        MapperController.LOGGER.debug("Executing animation")
+        # The animator leaves the points at mapped_xy, also when there is
+        # nothing to animate (first mapping or unchanged vectors)
+        self._animator.get_animation_sequence(self._mapped_xy, mapped_xy)
+        self._last_mapped_points_df = mapped_points_df
+        self._mapped_xy = mapped_xy
+
+        return mapped_points_df
+
+    # Will recalculate the mapping for the points, returning the mapped points
+    # as a (pandas.DataFrame) with shape (point_name X {x, y}).
+    # set_animator rebinds it on each instance to the specialized version, so
+    # no check for the animator is made on every call
+    execute_mapping = _execute_mapping_plain
+
     def get_mapped_points(self):
         return self._last_mapped_points_df
 
@@ -57,3 +153,7 @@ class MapperController(AbstractAlgorithmController):
         """
         MapperController.LOGGER.debug("Updating animator")
         self._animator = animator
+        if animator:
+            self.execute_mapping = self._execute_mapping_animated
+        else:
+            self.execute_mapping = self._execute_mapping_plain
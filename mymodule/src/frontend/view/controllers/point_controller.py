@@ -2,12 +2,18 @@
     Point Controller
 """
 import logging
+import numpy as np
 from bokeh.models import ColumnDataSource
 
 
 class PointController(object):
     """Controls the point column data source"""
     LOGGER = logging.getLogger(__name__)
+    # Up to this fraction of changed points a column is patched instead of
+    # replaced
+    PATCH_RATIO = 0.5
+    # Size differences (in pixels) below this are not sent to the browser
+    SIZE_TOLERANCE = 0.01
 
     @staticmethod
     def _get_unique_names(names):
@@ -54,20 +60,53 @@ class PointController(object):
         return name in self._source.data['name']
 
     def update_coordinates(self, x, y):
-        self._source.data['x'] = x
-        self._source.data['y'] = y
+        if x is self._source.data['x'] and y is self._source.data['y']:
+            # The same buffers were modified in place, Bokeh cannot detect
+            # the change by itself
+            self._source.trigger('data', self._source.data, self._source.data)
+            return
+        # Both columns in a single change so Bokeh notifies (and the browser
+        # redraws) once
+        self._source.data.update(x=x, y=y)
 
     def update_categories(self, categories):
         self._source.data['category'] = categories
 
     def update_colors(self, colors):
-        self._source.data['color'] = colors
+        self._update_column('color', colors)
 
     def update_errors(self, errors):
         self._source.data['error'] = errors
 
     def update_sizes(self, sizes):
-        self._source.data['size'] = sizes
+        self._update_column('size', sizes, tolerance=PointController.SIZE_TOLERANCE)
+
+    def _update_column(self, column, new_values, tolerance=None):
+        """Will send only the rows of the column that changed when they are
+           a few, replacing the whole column otherwise
+           column: (String) name of the column in the source
+           new_values: (numpy.ndarray || List) new value for every point
+           [tolerance=None]: (float) numeric differences up to this value
+                             are ignored
+        """
+        old_values = self._source.data[column]
+        if len(old_values) != len(new_values):
+            self._source.data[column] = new_values
+            return
+        new_array = np.asarray(new_values)
+        if tolerance is None:
+            changed = np.flatnonzero(np.asarray(old_values) != new_array)
+        else:
+            changed = np.flatnonzero(np.abs(np.asarray(old_values) - new_array) > tolerance)
+        if not changed.size:
+            return
+        if changed.size > len(new_array) * PointController.PATCH_RATIO:
+            self._source.data[column] = new_values
+            return
+        self._source.patch({
+            # Assigned as: (indexToReplace, newValue)
+            column: zip(changed.tolist(), new_array[changed].tolist())
+        })
 
     def add_attribute(self, attr_name, items):
         self._source.add(items, name=attr_name)
@@ -2,6 +2,7 @@
     Point Size controller
 """
 import logging
+import numpy as np
 from ....backend.util.line_equation import calculate_line_equation
 
 class PointSizeController(object):
@@ -52,18 +53,26 @@ class PointSizeController(object):
         """
         new_size = PointSizeController._get_valid_size(new_size)
         no_points = self._point_controller.get_number_of_points()
-        self._point_controller.update_sizes([new_size for i in range(0, no_points)])
+        self._point_controller.update_sizes(np.full(no_points, new_size, dtype=np.int32))
 
     def set_initial_size(self, new_size):
         """new_size: (int >= MIN_SIZE)"""
         self._initial_size = PointSizeController._get_valid_size(new_size)
+        self._update_line_equation()
         self.update_sizes()
 
     def set_final_size(self, new_size):
         """new_size: (int >= MIN_SIZE)"""
         self._final_size = PointSizeController._get_valid_size(new_size)
+        self._update_line_equation()
         self.update_sizes()
 
+    def _update_line_equation(self):
+        """The line only changes with the initial or final sizes, so it is
+           calculated once here instead of on every update_sizes call
+        """
+        self._m, self._c = self._calculate_line_equation(self._initial_size, self._final_size)
+
     def get_initial_size(self):
         return self._initial_size
 
@@ -78,5 +87,10 @@ class PointSizeController(object):
         point_error_s = self._error_controller.get_last_point_error(normalized=True)
         PointSizeController.LOGGER.debug("Updating sizes: %s-%s",
                                          self._initial_size, self._final_size)
-        self._m, self._c = self._calculate_line_equation(self._initial_size, self._final_size)
-        self._point_controller.update_sizes(self._m * point_error_s + self._c)
+        # float32 is more than enough for pixel sizes. np.array always copies,
+        # so the error series is left untouched and the copy is reused as
+        # the output of the in-place multiply-add
+        sizes = np.array(point_error_s, dtype=np.float32)
+        np.multiply(sizes, np.float32(self._m), out=sizes)
+        np.add(sizes, np.float32(self._c), out=sizes)
+        self._point_controller.update_sizes(sizes)
@@ -38,9 +38,7 @@ class VectorController(object):
     def update_vector_values(self, new_vectors):
         #TODO gchicafernandez - Use update_single_vector implementation
         VectorController.LOGGER.debug("Updating vector values")
-        for vector_id in new_vectors.index:
-            self._vectors_df['x'][vector_id] = new_vectors['x'][vector_id]
-            self._vectors_df['y'][vector_id] = new_vectors['y'][vector_id]
+        self._vectors_df.loc[new_vectors.index, ['x', 'y']] = new_vectors[['x', 'y']].values
 
     def update_single_vector(self, axis_id, x1, y1):
         """Updates the vectors dataframe with the new coordinates
@@ -4,10 +4,11 @@
 
 from __future__ import division
 import logging
-from bokeh.layouts import row, column
+import numpy as np
+from bokeh.io import curdoc
+from bokeh.layouts import row
 from bokeh.plotting import figure
-from bokeh.models import Label, ColumnDataSource, LabelSet, HoverTool, WheelZoomTool,\
-                         PanTool, PolySelectTool, TapTool, ResizeTool, SaveTool, ResetTool
+from bokeh.models import ColumnDataSource, LabelSet, WheelZoomTool, PanTool, SaveTool, ResetTool
 
 from ...backend.io.reader import Reader
 
@@ -23,7 +24,6 @@ from .controllers.point_controller import PointController
 from .controllers.error_controller import ErrorController
 from .controllers.color_controller import ColorController
 from .controllers.hover_controller import HoverController
-from .figure_element.axis_figure_element import AxisFigureElement
 from ..bokeh_extension.dragtool import DragTool
 from .animation.mapping_animator import MappingAnimator
 
@@ -46,6 +46,11 @@ class StarCoordinatesView(object):
 
     _N_A = 'N/A'
 
+    # Minimum displacement of a dragged axis to remap the points
+    _REMAP_EPSILON = 1e-9
+    # Time to wait for more drops before remapping after a drag (ms)
+    _REMAP_DELAY = 30
+
     POINT_LABEL_OPTIONS = ['ON', 'OFF']
 
     # The center is a constant across the application and should not be modified
@@ -69,15 +74,25 @@ class StarCoordinatesView(object):
         # Figure elements
         self._figure = None
         self._layout = None
-        self._drag_tool_sources = None
-        self._axis_sources = []
-        self._axis_elements = dict()
+        # True when the figure changed after the last layout was built
+        self._layout_dirty = True
+        # True once the figure has been handed out to be displayed
+        self._figure_shown = False
+        self._axis_source = None
+        # Axis name -> row of the axis in the axis source
+        self._axis_index = dict()
+        # Visibility of each axis, aligned with the rows of the axis source
+        self._axis_visible = None
         self._square_mapper = None
+        self._remap_scheduled = False
         self._source_points = None
         self._mapped_points = None
         self._labels_points = None
         self._checkboxes = None
         self._table_widget = None
+        # Labels of the input data, which do not change during the view life
+        self._dimensional_labels = None
+        self._nominal_labels = None
         # Controllers
         self._input_data_controller = None
         self._vector_controller = None
@@ -91,6 +106,8 @@ class StarCoordinatesView(object):
         self._error_controller = None
         self._color_controller = None
         self._hover_controller = None
+        # Figure tools, created once and moved to every new figure
+        self._tools = None
         # Logic to initialize all the elements from above
         self._init()
 
@@ -101,19 +118,19 @@ class StarCoordinatesView(object):
 
         raw_input_df = Reader.read_from_file(self._file_controller.get_active_file())
         self._input_data_controller = InputDataController(raw_input_df)
+        self._dimensional_labels = self._input_data_controller.get_dimensional_labels()
+        self._nominal_labels = self._input_data_controller.get_nominal_labels()
         self._vector_controller = VectorController(self._input_data_controller)
         self._normalization_controller = NormalizationController(self._input_data_controller)
         self._normalization_controller.execute_normalization()
 
         # Initialize figure and axis
         self._figure = self._init_figure()
-        self._axis_sources = self._init_axis()
+        self._axis_source = self._init_axis()
 
         # Add our custom drag and drop tool for resizing axis
-        self._drag_tool_sources = ColumnDataSource(dict(active_sources=[]))
-        self._drag_tool_sources.data['active_sources'] = [source for source in self._axis_sources]
         self._square_mapper = self._init_square_mapper()
-        self._figure.add_tools(DragTool(sources=self._drag_tool_sources,
+        self._figure.add_tools(DragTool(source=self._axis_source,
                                         remap_square=self._square_mapper))
 
         self._cluster_controller = ClusterController(self._normalization_controller)
@@ -121,7 +138,7 @@ class StarCoordinatesView(object):
         self._classification_controller = ClassificationController(self._input_data_controller,
                                                                    self._cluster_controller,
                                                                    self._normalization_controller,
-                                                                   self._axis_sources)
+                                                                   self._axis_source)
 
         self._point_controller = PointController(self._input_data_controller,
                                                  self._classification_controller)
@@ -139,7 +156,7 @@ class StarCoordinatesView(object):
                                                  self._vector_controller,
                                                  self._mapper_controller,
                                                  self._point_controller,
-                                                 self._axis_sources)
+                                                 self._axis_source)
         self._error_controller.calculate_error()
 
         self._point_size_controller = PointSizeController(self._error_controller,
@@ -152,20 +169,20 @@ class StarCoordinatesView(object):
         self._color_controller.update_colors()
 
         # Add the nominal and dimensional columns to the source_points so we can show them in the hover
-        self._set_values_to_sources(self._input_data_controller.get_dimensional_labels())
-        self._set_values_to_sources(self._input_data_controller.get_nominal_labels())
+        self._set_values_to_sources(self._dimensional_labels)
+        self._set_values_to_sources(self._nominal_labels)
 
         self._init_points()
-        self._layout = column(self._figure)
 
     def _set_values_to_sources(self, labels):
+        # The axis source holds a row per axis, so it needs one 'N/A' per axis
+        na_column = [StarCoordinatesView._N_A] * len(self._axis_index)
         for label in labels:
             values = self._input_data_controller.get_column_from_raw_input(label)
             self._point_controller.add_attribute(label, values)
             # Additionally, set 'N/A' to the axis
             # TODO gchicafernandez - Remove once axis widget has been implemented
-            for axis_source in self._axis_sources:
-                axis_source.add([StarCoordinatesView._N_A for i in values], name=label)
+            self._axis_source.add(na_column, name=label)
 
     def _init_square_mapper(self):
         def remap(attr, old, new):
@@ -175,35 +192,58 @@ class StarCoordinatesView(object):
                                              self._square_mapper.glyph.x,
                                              self._square_mapper.glyph.y)
             modified_axis_id = self._square_mapper.glyph.name
-            self._vector_controller.update_single_vector(modified_axis_id,
-                                                         self._square_mapper.glyph.x,
-                                                         self._square_mapper.glyph.y)
+            new_x = self._square_mapper.glyph.x
+            new_y = self._square_mapper.glyph.y
+            index = self._axis_index[modified_axis_id]
+            # A click without displacement does not change the mapping
+            if abs(new_x - self._axis_source.data['x1'][index]) < StarCoordinatesView._REMAP_EPSILON\
+               and abs(new_y - self._axis_source.data['y1'][index]) < StarCoordinatesView._REMAP_EPSILON:
+                return
+            self._vector_controller.update_single_vector(modified_axis_id, new_x, new_y)
             # The axis position won't be persisted across views unless we
             # update the source's value on the python's side
-            for source in self._axis_sources:
-                if source.data['name'][0] == modified_axis_id:
-                    source.data['x1'][0] = self._square_mapper.glyph.x
-                    source.data['y1'][0] = self._square_mapper.glyph.y
-            self._execute_mapping()
+            self._axis_source.patch({
+                # Assigned as: (indexToReplace, newValue)
+                'x1': [(index, new_x)],
+                'y1': [(index, new_y)]
+            })
+            self._schedule_remap()
 
         square = self._figure.square(x=0, y=0, name='remap', size=0)
         square.on_change('visible', remap)
         return square
 
+    def _schedule_remap(self):
+        """Will execute the mapping once for all the drops received in the
+           next _REMAP_DELAY ms, since each of them supersedes the previous
+           one. Without a server session the mapping is executed right away
+        """
+        document = curdoc()
+        if document.session_context is None:
+            self._execute_mapping()
+        elif not self._remap_scheduled:
+            self._remap_scheduled = True
+            document.add_timeout_callback(self._flush_remap, StarCoordinatesView._REMAP_DELAY)
+
+    def _flush_remap(self):
+        self._remap_scheduled = False
+        self._execute_mapping()
+
     def _init_figure(self):
         """Updates the visual elements on the figure"""
-        wheel_zoom_tool = WheelZoomTool()
-        pan_tool = PanTool()
-        resize_tool = ResizeTool()
-        save_tool = SaveTool()
-        reset_tool = ResetTool()
-        figure_ = figure(tools=[wheel_zoom_tool, pan_tool, resize_tool, save_tool, reset_tool],
-                         width=self._width, height=self._height)
-        figure_.toolbar.active_scroll = wheel_zoom_tool
+        if self._tools is None:
+            self._tools = [WheelZoomTool(), PanTool(), SaveTool(), ResetTool()]
+        else:
+            # A tool belongs to a single plot, release it from the old figure
+            for tool in self._tools:
+                tool.plot = None
+        # WebGL draws the point circles in a single pass on the GPU. Glyphs
+        # without WebGL support (e.g. labels) are still drawn on the canvas
+        figure_ = figure(tools=self._tools, width=self._width, height=self._height, webgl=True)
+        # The first tool is the WheelZoomTool
+        figure_.toolbar.active_scroll = self._tools[0]
         
-        hover_tips = ['name'] \
-                    + self._input_data_controller.get_nominal_labels() \
-                    + self._input_data_controller.get_dimensional_labels()
+        hover_tips = ['name'] + self._nominal_labels + self._dimensional_labels
 
         if self._hover_controller is None:
             self._hover_controller = HoverController(figure_, properties=hover_tips)
@@ -212,68 +252,87 @@ class StarCoordinatesView(object):
 
         return figure_
 
-    def _add_axis_element(self, source, name, is_visible):
-        segment = self._figure.segment(x0='x0',
-                                       y0='y0',
-                                       x1='x1',
-                                       y1='y1',
-                                       name=name,
-                                       color='color',
-                                       line_width='line_width',
-                                       source=source)
-
-        square = self._figure.square(x='x1',
-                                     y='y1',
-                                     source=source,
-                                     name=name,
-                                     size=StarCoordinatesView._SQUARE_SIZE,
-                                     color=StarCoordinatesView._SQUARE_COLOR,
-                                     alpha=StarCoordinatesView._SQUARE_ALPHA)
-
-        axis_figure_element = AxisFigureElement(segment, square)
-        axis_figure_element.visible(is_visible)
-        self._axis_elements[axis_figure_element.get_identifier()] = axis_figure_element
+    def _add_axis_renderers(self, source):
+        """Will draw the segment, square and label of every axis. Each
+           renderer draws all the rows of the axis source in a single pass
+           source: (ColumnDataSource) axis source with one row per axis
+        """
+        self._figure.segment(x0='x0',
+                             y0='y0',
+                             x1='x1',
+                             y1='y1',
+                             name='axis',
+                             color=StarCoordinatesView._SEGMENT_COLOR,
+                             line_width=StarCoordinatesView._SEGMENT_WIDTH,
+                             line_alpha='alpha',
+                             source=source)
+
+        # Hidden axis have a size of 0 so they can not be hovered either
+        self._figure.square(x='x1',
+                            y='y1',
+                            source=source,
+                            name='axis',
+                            size='size',
+                            color=StarCoordinatesView._SQUARE_COLOR,
+                            alpha=StarCoordinatesView._SQUARE_ALPHA)
+
         # Axis labels (name of their associated column)
         labels_dimensions = LabelSet(x='x1', y='y1', text='name', name='name', level='glyph',
-                                     x_offset=5, y_offset=5, source=source,
+                                     x_offset=5, y_offset=5, text_alpha='alpha', source=source,
                                      render_mode='canvas')
         self._figure.add_layout(labels_dimensions)
 
     def _init_axis(self, activation_list=None):
-        """Will render all axis (Segment, Square and Label) creating
-           for each one a source and an AxisFigureElement
+        """Will render all axis (Segment, Square and Label) from a single
+           source with one row per axis
 
            [activation_list=None]: list with axis indexes to be visible
                                    by default. If none is specified, all
                                    of them will be visible
 
-           Returns: (ColumnDataSource[]) list of sources (where each
-                        source is the base source of one axis)
-                    (AxisFigureElement[]) list of generated axis elements
+           Returns: (ColumnDataSource) source shared by all the axis, with
+                    the columns x0, y0, x1, y1, name, error, alpha and size
         """
-        sources_list = []
         vectors_df = self._vector_controller.get_vectors()
+        names = list(vectors_df.index.values)
+        n_axis = len(names)
         x0, y0 = StarCoordinatesView.CENTER_POINT
-        # Segments and squares
-        for i in range(0, len(vectors_df['x'])):
-            x1 = vectors_df['x'][i]
-            y1 = vectors_df['y'][i]
-            error = 0
-            name = vectors_df.index.values[i]
-            source = ColumnDataSource(dict(x0=[x0],
-                                           y0=[y0],
-                                           x1=[x1],
-                                           y1=[y1],
-                                           name=[name],
-                                           error=[error],
-                                           color=[StarCoordinatesView._SEGMENT_COLOR],
-                                           line_width=[StarCoordinatesView._SEGMENT_WIDTH]))
-            is_visible = not activation_list or i in activation_list
-            self._add_axis_element(source, name, is_visible)
-            # Add source to the list of sources for the error calculation upon axis
-            sources_list.append(source)
-
-        return sources_list
+        is_visible = np.ones(n_axis, dtype=bool)
+        if activation_list:
+            is_visible[:] = False
+            is_visible[activation_list] = True
+        # x1 and y1 are copied since the axis position is updated in place
+        source = ColumnDataSource(dict(x0=np.full(n_axis, x0, dtype=np.float64),
+                                       y0=np.full(n_axis, y0, dtype=np.float64),
+                                       x1=np.array(vectors_df['x'].values, dtype=np.float64),
+                                       y1=np.array(vectors_df['y'].values, dtype=np.float64),
+                                       name=names,
+                                       error=np.zeros(n_axis),
+                                       alpha=is_visible.astype(np.float64),
+                                       size=np.where(is_visible,
+                                                     StarCoordinatesView._SQUARE_SIZE, 0)))
+        self._axis_index = dict(zip(names, xrange(0, n_axis)))
+        self._axis_visible = is_visible
+        self._add_axis_renderers(source)
+
+        return source
+
+    def _set_axis_visible(self, index, show):
+        """Will show or hide the segment, square and label of an axis
+           index: (int) row of the axis in the axis source
+           show: (Boolean) Self explanatory
+           Returns: (Boolean) True if its visibility has changed
+        """
+        if self._axis_visible[index] == show:
+            return False
+        self._axis_visible[index] = show
+        size = StarCoordinatesView._SQUARE_SIZE if show else 0
+        self._axis_source.patch({
+            # Assigned as: (indexToReplace, newValue)
+            'alpha': [(index, float(show))],
+            'size': [(index, size)]
+        })
+        return True
 
     def _init_points(self):
         """Will draw the circles representing the dots on the plot
@@ -288,9 +347,13 @@ class StarCoordinatesView(object):
                             legend='category',
                             source=source_points)
 
+        # Hidden labels are not rendered at all. A redraw keeps their visibility
+        labels_visible = self._labels_points is not None and self._labels_points.visible
         self._labels_points = LabelSet(x='x', y='y', text='name', name='name', level='glyph',
-                                       x_offset=5, y_offset=5, text_font_size='0pt',
-                                       source=source_points, render_mode='canvas')
+                                       x_offset=5, y_offset=5,
+                                       text_font_size=StarCoordinatesView._POINT_LABEL_SIZE,
+                                       source=source_points, render_mode='canvas',
+                                       visible=labels_visible)
 
         self._figure.add_layout(self._labels_points)
 
@@ -322,24 +385,29 @@ class StarCoordinatesView(object):
 
     def _update_layout(self):
         self._layout = row(self._figure, name='view')
+        self._layout_dirty = False
 
     def _is_valid_point(self, name):
         return self._point_controller.is_valid_point(name)
 
     # PUBLIC methods available to the model
     def redraw(self):
+        # A figure never displayed can be shown as it is. Algorithm changes
+        # only update the sources, so the rebuild is only needed for a view
+        # displayed again
+        if not self._figure_shown:
+            return
         # Redraw plot
         self._figure = self._init_figure()
         # Add tools to new plot
-        self._figure.add_tools(DragTool(sources=self._drag_tool_sources,
+        self._figure.add_tools(DragTool(source=self._axis_source,
                                         remap_square=self._square_mapper))
-        # Redraw axis elements
-        for source in self._axis_sources:
-            name = source.data['name'][0]
-            is_visible = self._input_data_controller.is_label_active(name)
-            self._add_axis_element(source, name, is_visible)
+        # Redraw axis elements. Their visibility is kept by the axis source
+        self._add_axis_renderers(self._axis_source)
         # Redraw points
         self._init_points()
+        self._layout_dirty = True
+        self._figure_shown = False
 
     # UPDATE methods
     def update_mapping_algorithm(self, new):
@@ -385,12 +453,12 @@ class StarCoordinatesView(object):
 
     def update_axis_visibility(self, new):
         axis_id, is_visible = new
-        if not axis_id in self._axis_elements:
+        if not axis_id in self._axis_index:
             ValueError("Could not update the visibility of the axis '{}'\
                         because it is not a valid axis".format(axis_id))
         self._input_data_controller.update_label_status(axis_id, is_visible)
-        # Tries to hide the axis element. If a change is made then execute mapping
-        if self._axis_elements[axis_id].visible(is_visible):
+        # Tries to hide the axis. If a change is made then execute mapping
+        if self._set_axis_visible(self._axis_index[axis_id], is_visible):
             self._execute_mapping()
 
     def update_hover_tips_visibility(self, new):
@@ -400,10 +468,7 @@ class StarCoordinatesView(object):
             self._hover_controller.toggle_property(hover_tip)
 
     def update_point_label_visibility(self, new):
-        if new == 'ON':
-            self._labels_points.text_font_size = StarCoordinatesView._POINT_LABEL_SIZE
-        else:
-            self._labels_points.text_font_size = '0pt'
+        self._labels_points.visible = new == 'ON'
 
     def update_number_of_clusters(self, new):
         # Will update the cluster categories too
@@ -524,11 +589,13 @@ class StarCoordinatesView(object):
         return self._color_controller.get_selected_point()
 
     def get_layout(self):
-        self._update_layout()
+        if self._layout_dirty:
+            self._update_layout()
+        self._figure_shown = True
         return self._layout
 
     def get_point_label_visibility(self):
-        if self._labels_points.text_font_size == StarCoordinatesView._POINT_LABEL_SIZE:
+        if self._labels_points.visible:
             return 'ON'
         return 'OFF'
 
@@ -538,4 +605,4 @@ class StarCoordinatesView(object):
     def set_checkboxes(self, checkboxes):
         self._checkboxes = checkboxes
         self._checkboxes.update_view(self)
-        self._update_layout()
+        self._layout_dirty = True
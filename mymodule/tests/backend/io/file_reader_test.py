@@ -0,0 +1,47 @@
+import glob
+import os
+import tempfile
+import unittest
+from os.path import dirname, join
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+from ....src.backend.io import file_reader
+from ....src.backend.io.file_reader import FileReader
+
+SAMPLE_FILES = glob.glob(join(dirname(__file__), '..', '..', '..', '..', 'sample_files', '*.csv'))
+
+class FileReaderTest(unittest.TestCase):
+    def test_sample_files(self):
+        self.assertTrue(SAMPLE_FILES, 'No sample files found')
+
+    @unittest.skipIf(file_reader.pa_csv is None, 'PyArrow is not installed')
+    def test_read_file_arrow(self):
+        for file_path in SAMPLE_FILES:
+            for header in (True, False):
+                expected_df = pd.read_csv(file_path, sep=FileReader.DELIMITER,
+                                          header=0 if header else None, index_col=0)
+                dataframe = FileReader._read_file_arrow(file_path, FileReader.DELIMITER,
+                                                        header, 0)
+                self.assertEqual([type(column) for column in dataframe.columns],
+                                 [type(column) for column in expected_df.columns],
+                                 'Incorrect column name types')
+                self.assertEqual(list(dataframe.dtypes), list(expected_df.dtypes),
+                                 'Incorrect column dtypes')
+                # Same values, dtypes, index and columns as the pandas reader
+                assert_frame_equal(dataframe, expected_df)
+                assert_frame_equal(FileReader.read_file(file_path, header=header), expected_df)
+
+    @unittest.skipIf(file_reader.pa_csv is None, 'PyArrow is not installed')
+    def test_read_file_arrow_fallback(self):
+        # Arrow parses the dates as timestamps, pandas keeps them as text
+        file_descriptor, file_path = tempfile.mkstemp(suffix='.csv')
+        try:
+            with os.fdopen(file_descriptor, 'w') as csv_file:
+                csv_file.write('name;date;value\na;2017-01-01;1\nb;;NA\n')
+            self.assertIsNone(FileReader._read_file_arrow(file_path, FileReader.DELIMITER,
+                                                          True, 0),
+                              'Timestamps must not be read with PyArrow')
+            assert_frame_equal(FileReader.read_file(file_path),
+                               pd.read_csv(file_path, sep=FileReader.DELIMITER, index_col=0))
+        finally:
+            os.remove(file_path)
@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ....src.backend.util.error_utils import ErrorUtils
+
+class ErrorUtilsTest(unittest.TestCase):
+    @staticmethod
+    def _get_general_error_df_pandas(values_df, vectors_df, mapped_points_df):
+        """Pandas formulation of ErrorUtils.get_general_error_df, column by column"""
+        def get_column_error(column, vectors_df, mapped_points_df_t):
+            column_error_x = ((column * vectors_df['x']).abs()
+                              - mapped_points_df_t[column.name]['x']).abs()
+            column_error_y = ((column * vectors_df['y']).abs()
+                              - mapped_points_df_t[column.name]['y']).abs()
+            return column_error_x + column_error_y
+
+        values_df_t = values_df.transpose()
+        mapped_points_df_t = mapped_points_df.transpose()
+        column_ids = [i for i in xrange(0, len(values_df_t.columns))]
+        values_df_t.columns = column_ids
+        mapped_points_df_t.columns = column_ids
+        values_df_t = values_df_t.apply(lambda column: get_column_error(column, vectors_df,
+                                                                        mapped_points_df_t),
+                                        axis=0)
+        return values_df_t.transpose()
+
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        # Repeated point names and vectors in a different order than the values
+        names = ['a', 'b', 'a', 'c', 'd']
+        self.values_df = pd.DataFrame(random_state.rand(5, 3), index=names,
+                                      columns=['d0', 'd1', 'd2'])
+        self.vectors_df = pd.DataFrame(random_state.randn(3, 2), index=['d2', 'd0', 'd1'],
+                                       columns=['x', 'y'])
+        self.mapped_points_df = pd.DataFrame(random_state.randn(5, 2), index=names,
+                                             columns=['x', 'y'])
+
+    def test_get_general_error_df(self):
+        general_error_df = ErrorUtils.get_general_error_df(self.values_df, self.vectors_df,
+                                                           self.mapped_points_df)
+        expected_df = ErrorUtilsTest._get_general_error_df_pandas(self.values_df,
+                                                                  self.vectors_df,
+                                                                  self.mapped_points_df)
+        self.assertTrue(np.allclose(general_error_df.values, expected_df.values),
+                        'Incorrect general error values')
+        self.assertTrue(general_error_df.index.equals(expected_df.index),
+                        'Incorrect general error index')
+        self.assertTrue(general_error_df.columns.equals(expected_df.columns),
+                        'Incorrect general error columns')
+        self.assertEqual(general_error_df.values.dtype, np.float64,
+                         'Incorrect general error type')
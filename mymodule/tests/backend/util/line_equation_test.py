@@ -0,0 +1,28 @@
+import unittest
+import numpy as np
+from ....src.backend.util.line_equation import calculate_line_equation, calculate_line_equations
+
+class LineEquationTest(unittest.TestCase):
+    def setUp(self):
+        self.x0 = np.array([0., 1., -2., 3.])
+        self.x1 = np.array([1., 3., 2., 3.])
+        self.y0 = np.array([1., 2., 0., 5.])
+        self.y1 = np.array([3., -2., 4., 7.])
+
+    def test_calculate_line_equation(self):
+        m, c = calculate_line_equation((0, 1), (4, 12))
+        self.assertAlmostEqual(m, 8, msg='Incorrect m constant')
+        self.assertAlmostEqual(c, 4, msg='Incorrect c constant')
+
+    def test_calculate_line_equations(self):
+        m, c = calculate_line_equations((self.x0, self.x1), (self.y0, self.y1))
+        for i in range(0, 3):
+            m_i, c_i = calculate_line_equation((self.x0[i], self.x1[i]),
+                                               (self.y0[i], self.y1[i]))
+            self.assertAlmostEqual(m[i], m_i, msg='Incorrect m constant for line {}'.format(i))
+            self.assertAlmostEqual(c[i], c_i, msg='Incorrect c constant for line {}'.format(i))
+
+    def test_calculate_line_equations_vertical(self):
+        m, c = calculate_line_equations((self.x0, self.x1), (self.y0, self.y1))
+        self.assertEqual(m[3], 0, 'Vertical lines must have m = 0')
+        self.assertEqual(c[3], self.y0[3], 'Vertical lines must have c = y0')
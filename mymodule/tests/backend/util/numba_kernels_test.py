@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from ....src.backend.util import numba_kernels
+from ....src.backend.util.numba_kernels import general_error
+
+class NumbaKernelsTest(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self.values = random_state.rand(20, 4)
+        self.vectors_x = random_state.randn(4)
+        self.vectors_y = random_state.randn(4)
+        self.mapped_x = self.values.dot(self.vectors_x)
+        self.mapped_y = self.values.dot(self.vectors_y)
+        self.expected = np.abs(np.abs(self.values * self.vectors_x) - self.mapped_x[:, None])\
+                        + np.abs(np.abs(self.values * self.vectors_y) - self.mapped_y[:, None])
+
+    def test_general_error(self):
+        error = general_error(self.values, self.vectors_x, self.vectors_y,
+                              self.mapped_x, self.mapped_y)
+        self.assertTrue(np.allclose(error, self.expected), 'Incorrect general error')
+
+    def test_general_error_numpy(self):
+        error = np.empty(self.values.shape)
+        numba_kernels._general_error_numpy(self.values, self.vectors_x, self.vectors_y,
+                                           self.mapped_x, self.mapped_y, error)
+        self.assertTrue(np.allclose(error, self.expected), 'Incorrect NumPy general error')
+
+    def test_compute_frame(self):
+        kernels = [numba_kernels.compute_frame, numba_kernels._compute_frame_array,
+                   numba_kernels._compute_frame_loop]
+        if numba_kernels.njit is not None:
+            kernels += [numba_kernels._compute_frame_serial,
+                        numba_kernels._compute_frame_parallel]
+        random_state = np.random.RandomState(0)
+        # Below and above the threshold of the parallel kernel
+        for n_points in (20, numba_kernels.PARALLEL_THRESHOLD + 1000):
+            x0, y0, dx, m = random_state.randn(4, n_points).astype(np.float32)
+            expected_x = x0 + 0.25 * dx
+            expected_y = y0 + m * 0.25 * dx
+            for kernel in kernels:
+                x_out, y_out = np.empty_like(x0), np.empty_like(y0)
+                kernel(x0, y0, dx, m, np.float32(0.25), x_out, y_out)
+                self.assertTrue(np.allclose(x_out, expected_x),
+                                'Incorrect frame x coordinates of {}'.format(kernel.__name__))
+                self.assertTrue(np.allclose(y_out, expected_y),
+                                'Incorrect frame y coordinates of {}'.format(kernel.__name__))
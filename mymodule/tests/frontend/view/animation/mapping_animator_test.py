@@ -0,0 +1,129 @@
+import unittest
+import numpy as np
+from bokeh.document import Document
+from .....src.frontend.view.animation import mapping_animator
+from .....src.frontend.view.animation.mapping_animator import MappingAnimator
+
+class FakePointController(object):
+    def __init__(self, n_points):
+        self.n_points = n_points
+        self.frames = []
+
+    def get_number_of_points(self):
+        return self.n_points
+
+    def update_coordinates(self, x, y):
+        self.frames.append((np.array(x), np.array(y)))
+
+class FakePeriodicCallback(object):
+    def __init__(self, callback):
+        self.callback = callback
+
+class FakeDocument(object):
+    """As Bokeh, returns a PeriodicCallback but removes the callbacks by
+       their function
+    """
+    def __init__(self, session_context=True):
+        self.session_context = session_context
+        self.callbacks = dict()
+
+    def add_periodic_callback(self, callback, period_milliseconds):
+        if callback in self.callbacks:
+            raise ValueError('callback has already been added')
+        self.callbacks[callback] = FakePeriodicCallback(callback)
+        return self.callbacks[callback]
+
+    def remove_periodic_callback(self, callback):
+        if callback not in self.callbacks:
+            raise ValueError('callback already ran or was already removed')
+        del self.callbacks[callback]
+
+class SessionDocument(Document):
+    """Bokeh document of a server session"""
+    session_context = True
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.
+
+    def time(self):
+        return self.now
+
+class MappingAnimatorTest(unittest.TestCase):
+    def setUp(self):
+        self.point_controller = FakePointController(4)
+        self.animator = MappingAnimator(self.point_controller)
+        self.original_xy = np.zeros((2, 4), dtype=np.float32)
+        self.mapped_xy = np.array([[1, 2, 3, 4], [4, 3, 2, 1]], dtype=np.float32)
+        self.clock = FakeClock()
+        self._time = mapping_animator.time
+        mapping_animator.time = self.clock
+
+    def tearDown(self):
+        mapping_animator.time = self._time
+
+    def _tick(self, document, seconds):
+        self.clock.now += seconds
+        callbacks = document.callbacks if isinstance(document, FakeDocument)\
+                    else [callback.callback for callback in document.session_callbacks]
+        self.assertEqual(len(callbacks), 1, 'Only one animation must be played')
+        list(callbacks)[0]()
+
+    def _assert_mapped(self):
+        x, y = self.point_controller.frames[-1]
+        self.assertTrue(np.array_equal(x, self.mapped_xy[0]) and np.array_equal(y, self.mapped_xy[1]),
+                        'Points must end at the mapped position')
+
+    def test_get_progress_sequence(self):
+        progress_s = MappingAnimator.get_progress_sequence(120)
+        self.assertTrue(len(progress_s) < 120, 'Frames after reaching 1 must be dropped')
+        self.assertTrue(progress_s[0] > 0, 'The original position is not a frame')
+        self.assertEqual(progress_s[-1], 1, 'The last frame must be the final position')
+        self.assertEqual(len(set(progress_s.tolist())), len(progress_s), 'Repeated frames')
+        self.assertEqual(MappingAnimator.get_progress_sequence(3)[-1], 1,
+                         'Short sequences must end on the final position')
+
+    def test_no_session(self):
+        document = FakeDocument(session_context=None)
+        self.animator.get_animation_sequence(self.original_xy, self.mapped_xy, document=document)
+        self.assertEqual(len(self.point_controller.frames), 1, 'Points must be moved at once')
+        self.assertFalse(document.callbacks, 'No animation must be scheduled')
+
+    def test_paced_animation(self):
+        document = FakeDocument()
+        self.animator.get_animation_sequence(self.original_xy, self.mapped_xy,
+                                             max_time=1, document=document)
+        self.assertFalse(self.point_controller.frames, 'Frames must wait for the callback')
+        self._tick(document, 1. / MappingAnimator.TARGET_FPS)
+        self._tick(document, 0)
+        self.assertEqual(len(self.point_controller.frames), 1, 'A frame must be shown once')
+        # A late callback skips to the frame due
+        self._tick(document, 10. / MappingAnimator.TARGET_FPS)
+        self.assertEqual(len(self.point_controller.frames), 2, 'Late frames must be skipped')
+        self._tick(document, 1)
+        self._assert_mapped()
+        self.assertFalse(document.callbacks, 'The animation must stop at the end')
+
+    def test_bokeh_document(self):
+        document = SessionDocument()
+        self.animator.get_animation_sequence(self.original_xy, self.mapped_xy,
+                                             max_time=1, document=document)
+        self._tick(document, 1. / MappingAnimator.TARGET_FPS)
+        self.animator.get_animation_sequence(self.original_xy, self.mapped_xy,
+                                             max_time=1, document=document)
+        self._tick(document, 1)
+        self._assert_mapped()
+        self.assertFalse(document.session_callbacks, 'The animation must stop at the end')
+
+    def test_new_animation_stops_previous(self):
+        document = FakeDocument()
+        self.animator.get_animation_sequence(self.original_xy, self.mapped_xy, document=document)
+        self._tick(document, 1. / MappingAnimator.TARGET_FPS)
+        # Started in the middle of the previous one
+        self.animator.get_animation_sequence(self.mapped_xy, self.original_xy, document=document)
+        self.assertEqual(len(document.callbacks), 1, 'Only one animation must be played')
+        self._tick(document, 1)
+        x, y = self.point_controller.frames[-1]
+        self.assertTrue(np.array_equal(x, self.original_xy[0]) and np.array_equal(y, self.original_xy[1]),
+                        'Points must end at the position of the last animation')
+        self.assertFalse(document.callbacks, 'The animation must stop at the end')
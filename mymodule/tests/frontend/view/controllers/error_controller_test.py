@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.controllers.error_controller import ErrorController
+from .....src.frontend.view.controllers.mapper_controller import MapperController
+from .....src.backend.algorithms.mapping.star_coordinates_mapper import star_coordinates
+from .mapper_controller_test import FakePointController, FakeVectorController
+from .mapper_controller_test import FakeNormalizationController as FakeValuesController
+
+class FakeNormalizationController(object):
+    def get_active_algorithm_id(self):
+        return 'Feature Scaling'
+
+class ErrorControllerTest(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        values = random_state.rand(40, 4)
+        self.values_df = pd.DataFrame(values, columns=['d0', 'd1', 'd2', 'd3'])
+        self.vectors_df = pd.DataFrame(random_state.randn(4, 2), index=self.values_df.columns,
+                                       columns=['x', 'y'])
+        self.error_controller = ErrorController(FakeNormalizationController(), None, None,
+                                                None, None)
+        self._cache_min_values = ErrorController.CACHE_MIN_VALUES
+        # The error of every call is cached
+        ErrorController.CACHE_MIN_VALUES = 0
+        self.calls = []
+        algorithm = self.error_controller._active_algorithm
+
+        def count_calls(*args, **kwargs):
+            self.calls.append(args)
+            return algorithm(*args, **kwargs)
+        self.error_controller._active_algorithm = count_calls
+
+    def tearDown(self):
+        ErrorController.CACHE_MIN_VALUES = self._cache_min_values
+
+    def _drag(self, axis_id, x, y):
+        """Returns: (pandas.DataFrame) vectors with the axis moved
+                    (pandas.DataFrame) points mapped with them
+        """
+        vectors_df = self.vectors_df.copy()
+        vectors_df.loc[axis_id, ['x', 'y']] = [x, y]
+        return vectors_df, star_coordinates(self.values_df, vectors_df)
+
+    def _execute_cached(self, vectors_df, mapped_points_df):
+        return self.error_controller._execute_cached(self.values_df, vectors_df,
+                                                     mapped_points_df)
+
+    def test_execute_cached(self):
+        mapped_points_df = star_coordinates(self.values_df, self.vectors_df)
+        axis_error_df, point_error_df = self._execute_cached(self.vectors_df, mapped_points_df)
+        self.assertEqual(len(self.calls), 1, 'The error must be calculated')
+        cached_errors = self._execute_cached(self.vectors_df.copy(), mapped_points_df.copy())
+        self.assertEqual(len(self.calls), 1, 'The same inputs must reuse the cached error')
+        self.assertIs(cached_errors[0], axis_error_df, 'Incorrect cached axis error')
+        self.assertIs(cached_errors[1], point_error_df, 'Incorrect cached point error')
+
+        vectors_df, mapped_points_df = self._drag('d1', 0.5, -2)
+        self._execute_cached(vectors_df, mapped_points_df)
+        self.assertEqual(len(self.calls), 2, 'Other inputs must be calculated')
+
+    def test_execute_cached_eviction(self):
+        inputs = [self._drag('d1', i, -i) for i in range(ErrorController.CACHE_SIZE + 1)]
+        for vectors_df, mapped_points_df in inputs:
+            self._execute_cached(vectors_df, mapped_points_df)
+        self.assertEqual(len(self.error_controller._error_cache), ErrorController.CACHE_SIZE,
+                         'Incorrect cache size')
+        # The most recent ones are kept
+        self._execute_cached(*inputs[-1])
+        self.assertEqual(len(self.calls), len(inputs), 'The last inputs must be cached')
+        # The least recently used one was evicted
+        self._execute_cached(*inputs[0])
+        self.assertEqual(len(self.calls), len(inputs) + 1, 'The first inputs must be evicted')
+
+    def test_execute_cached_small_values(self):
+        ErrorController.CACHE_MIN_VALUES = self.values_df.size + 1
+        mapped_points_df = star_coordinates(self.values_df, self.vectors_df)
+        self._execute_cached(self.vectors_df, mapped_points_df)
+        self._execute_cached(self.vectors_df, mapped_points_df)
+        self.assertEqual(len(self.calls), 2, 'Small values must not be cached')
+        self.assertFalse(self.error_controller._error_cache, 'Small values must not be cached')
+
+    def test_execute_cached_drag_back(self):
+        vectors_df = self.vectors_df.copy()
+        mapper_controller = MapperController(None, FakePointController(),
+                                             FakeVectorController(vectors_df),
+                                             FakeValuesController(self.values_df))
+        initial_vector = tuple(self.vectors_df.loc['d1'])
+        for x, y in [initial_vector, (0.5, -2), (1, 1), initial_vector]:
+            vectors_df.loc['d1', ['x', 'y']] = [x, y]
+            self._execute_cached(vectors_df, mapper_controller.execute_mapping())
+        self.assertEqual(len(self.calls), 3, 'Dragging an axis back must reuse the cached error')
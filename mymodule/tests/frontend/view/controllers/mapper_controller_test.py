@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+import pandas as pd
+from .....src.frontend.view.controllers.mapper_controller import MapperController
+from .....src.backend.algorithms.mapping.star_coordinates_mapper import star_coordinates
+
+class FakePointController(object):
+    def update_coordinates(self, x, y):
+        pass
+
+class FakeVectorController(object):
+    def __init__(self, vectors_df):
+        self.vectors_df = vectors_df
+
+    def get_vectors(self):
+        return self.vectors_df
+
+class FakeNormalizationController(object):
+    def __init__(self, values_df):
+        self.values_df = values_df
+
+    def get_last_normalized_values(self):
+        return self.values_df
+
+class MapperControllerTest(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        dimensions = ['d{}'.format(i) for i in range(6)]
+        self.values_df = pd.DataFrame(random_state.rand(50, 6), columns=dimensions)
+        self.vectors_df = pd.DataFrame(random_state.randn(6, 2), index=dimensions,
+                                       columns=['x', 'y'])
+        self.vector_controller = FakeVectorController(self.vectors_df)
+        self.normalization_controller = FakeNormalizationController(self.values_df)
+        self.mapper_controller = MapperController(None, FakePointController(),
+                                                  self.vector_controller,
+                                                  self.normalization_controller)
+
+    def _assert_mapping(self, msg):
+        mapped_points_df = self.mapper_controller.execute_mapping()
+        expected_df = star_coordinates(self.normalization_controller.values_df,
+                                       self.vector_controller.vectors_df)
+        self.assertTrue(np.allclose(mapped_points_df[['x', 'y']].values,
+                                    expected_df[['x', 'y']].values, rtol=0, atol=1e-12), msg)
+        return mapped_points_df
+
+    def test_execute_mapping(self):
+        self._assert_mapping('Incorrect initial mapping')
+        self.vectors_df.loc['d1', ['x', 'y']] = [0.5, -0.25]
+        self._assert_mapping('Incorrect mapping after dragging an axis')
+        self.vectors_df.loc['d3', ['x', 'y']] = [-1.5, 2.]
+        self.vectors_df.loc['d4', ['x', 'y']] = [0.75, 0.1]
+        self._assert_mapping('Incorrect mapping after dragging two axis')
+        # Hiding an axis filters the vectors and normalizes the values again
+        self.vector_controller.vectors_df = self.vectors_df.drop('d2')
+        self.normalization_controller.values_df = self.values_df.drop('d2', axis=1)
+        self._assert_mapping('Incorrect mapping after hiding an axis')
+
+        self.vector_controller.vectors_df = self.vectors_df
+        self.normalization_controller.values_df = self.values_df
+        self._assert_mapping('Incorrect mapping after showing an axis')
+
+    def test_execute_mapping_drag_back(self):
+        initial_df = self._assert_mapping('Incorrect initial mapping')
+        initial_vector = self.vectors_df.loc['d1', ['x', 'y']].values.copy()
+        for x, y in [(0.5, -0.25), (0.3, 0.7), (-2., 1.)]:
+            self.vectors_df.loc['d1', ['x', 'y']] = [x, y]
+            self._assert_mapping('Incorrect mapping after dragging an axis')
+        self.vectors_df.loc['d1', ['x', 'y']] = initial_vector
+        mapped_points_df = self._assert_mapping('Incorrect mapping after dragging an axis back')
+        self.assertTrue(np.array_equal(mapped_points_df.values, initial_df.values),
+                        'Same vectors must give the very same mapping')
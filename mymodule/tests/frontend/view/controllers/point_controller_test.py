@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from bokeh.models import ColumnDataSource
+from .....src.frontend.view.controllers.point_controller import PointController
+
+class FakeInputDataController(object):
+    def get_element_names(self):
+        return ['p{}'.format(i) for i in range(10)]
+
+class FakeClassificationController(object):
+    def get_categories(self):
+        return ['c'] * 10
+
+class PointControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.point_controller = PointController(FakeInputDataController(),
+                                                FakeClassificationController())
+        self.source = self.point_controller.get_source()
+        self.point_controller.update_sizes(np.arange(10, dtype=np.float32))
+        self.sizes = self.source.data['size']
+        self.patches = []
+        self._patch = ColumnDataSource.patch
+        patches = self.patches
+
+        def patch(source, patches_dict, *args, **kwargs):
+            patches.append(patches_dict)
+            return self._patch(source, patches_dict, *args, **kwargs)
+        ColumnDataSource.patch = patch
+
+    def tearDown(self):
+        ColumnDataSource.patch = self._patch
+
+    def test_update_sizes_patch(self):
+        new_sizes = np.arange(10, dtype=np.float32)
+        new_sizes[[2, 7]] = [20, 70]
+        self.point_controller.update_sizes(new_sizes)
+        self.assertEqual(len(self.patches), 1, 'A few changed sizes must be patched')
+        self.assertEqual(sorted(self.patches[0]['size']), [(2, 20), (7, 70)],
+                         'Only the changed sizes must be patched')
+        self.assertIs(self.source.data['size'], self.sizes, 'The column must not be replaced')
+        self.assertTrue(np.array_equal(self.source.data['size'], new_sizes), 'Incorrect sizes')
+
+    def test_update_sizes_replace(self):
+        new_sizes = np.arange(10, dtype=np.float32)
+        changed = int(len(new_sizes) * PointController.PATCH_RATIO) + 1
+        new_sizes[:changed] += 1
+        self.point_controller.update_sizes(new_sizes)
+        self.assertFalse(self.patches, 'Most changed sizes must not be patched')
+        self.assertIs(self.source.data['size'], new_sizes, 'The column must be replaced')
+
+    def test_update_sizes_tolerance(self):
+        new_sizes = np.arange(10, dtype=np.float32) + PointController.SIZE_TOLERANCE / 2
+        self.point_controller.update_sizes(new_sizes)
+        self.assertFalse(self.patches, 'Sizes within the tolerance must not be patched')
+        self.assertIs(self.source.data['size'], self.sizes, 'The column must not be replaced')
+        self.assertTrue(np.array_equal(self.source.data['size'], np.arange(10)),
+                        'Sizes within the tolerance must not change')
+
+    def test_update_colors(self):
+        self.point_controller.update_colors(['red'] * 10)
+        colors = ['red'] * 10
+        colors[3] = 'blue'
+        self.point_controller.update_colors(colors)
+        self.assertEqual(self.patches, [{'color': [(3, 'blue')]}],
+                         'Only the changed color must be patched')